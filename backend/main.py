@@ -1,37 +1,91 @@
 from fastapi import FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
-from enum import Enum
-import boto3
+from contextlib import AsyncExitStack, asynccontextmanager
+import aioboto3
+import msgspec
+from aiobotocore.config import AioConfig
 from boto3.dynamodb.conditions import Key, Attr
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 import os
 import uuid
 import re
+import asyncio
+import functools
+import time
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the DynamoDB resource on startup and close it on shutdown"""
+    await get_table()
+    yield
+    await close_dynamodb()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Events API",
     version="1.0.0",
     description="REST API for managing events with DynamoDB storage",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration - Configurable via environment variables
 ALLOWED_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
 CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'true').lower() == 'true'
 
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that reuses preflight responses.
+
+    The CORS settings are fixed at startup, so the preflight response only
+    depends on the request's origin, method and headers. This only helps
+    when serving with Uvicorn: the deployed Lambda Function URL answers
+    preflights itself (FunctionUrlCorsOptions in BackendStack), so they
+    never reach the app.
+    """
+    max_cached_preflights = 256
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self._preflight_cache = {}
+
+    def preflight_response(self, request_headers):
+        origin = request_headers.get("origin")
+        if self.allow_all_origins and not self.preflight_explicit_allow_origin:
+            # The response is "*" for every origin, so don't key on it
+            origin = None
+        key = (
+            origin,
+            request_headers.get("access-control-request-method"),
+            request_headers.get("access-control-request-headers"),
+        )
+        response = self._preflight_cache.get(key)
+        if response is None:
+            response = super().preflight_response(request_headers)
+            # Keys come from request headers, so keep the cache bounded by
+            # evicting the oldest entry
+            if len(self._preflight_cache) >= self.max_cached_preflights:
+                del self._preflight_cache[next(iter(self._preflight_cache))]
+            self._preflight_cache[key] = response
+        return response
+
+
 app.add_middleware(
-    CORSMiddleware,
+    CachedCORSMiddleware,
     allow_origins=ALLOWED_ORIGINS if ALLOWED_ORIGINS != ['*'] else ["*"],
     allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
@@ -47,18 +101,63 @@ app.add_middleware(
 )
 
 # DynamoDB setup
-try:
-    dynamodb = boto3.resource(
-        'dynamodb',
-        region_name=os.getenv('AWS_REGION', 'us-east-1'),
-        endpoint_url=os.getenv('AWS_ENDPOINT_URL')  # For local DynamoDB
-    )
-    table_name = os.getenv('DYNAMODB_TABLE_NAME', 'events-table')
-    table = dynamodb.Table(table_name)
-    logger.info(f"Connected to DynamoDB table: {table_name}")
-except Exception as e:
-    logger.error(f"Failed to connect to DynamoDB: {str(e)}")
-    raise
+# GSI with 'status' as partition key (see BackendStack)
+STATUS_INDEX_NAME = 'StatusIndex'
+# Per-request item limits of BatchWriteItem and BatchGetItem
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+# Retries of UnprocessedKeys in batch gets, with exponential backoff (seconds)
+BATCH_GET_MAX_ATTEMPTS = 5
+BATCH_GET_BASE_DELAY = 0.05
+
+table_name = os.getenv('DYNAMODB_TABLE_NAME', 'events-table')
+session = aioboto3.Session()
+# Larger pool for concurrent requests on one event loop. Stale sockets are
+# already handled by aiobotocore's default aiohttp keepalive_timeout (12s),
+# which is below DynamoDB's ~20s idle cutoff.
+dynamodb_config = AioConfig(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=1,
+    read_timeout=5,
+)
+_dynamodb_stack = AsyncExitStack()
+_dynamodb_lock = asyncio.Lock()
+app.state.dynamodb = None
+app.state.table = None
+
+
+async def get_table():
+    """Return the shared DynamoDB table, opening the resource on first use.
+
+    On Lambda the resource is opened during init (see the handler setup at
+    the end of this module) and reused across warm invocations.
+    """
+    if app.state.table is None:
+        async with _dynamodb_lock:
+            if app.state.table is None:
+                try:
+                    app.state.dynamodb = await _dynamodb_stack.enter_async_context(
+                        session.resource(
+                            'dynamodb',
+                            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+                            endpoint_url=os.getenv('AWS_ENDPOINT_URL'),  # For local DynamoDB
+                            config=dynamodb_config
+                        )
+                    )
+                    app.state.table = await app.state.dynamodb.Table(table_name)
+                    logger.info(f"Connected to DynamoDB table: {table_name}")
+                except Exception as e:
+                    logger.error(f"Failed to connect to DynamoDB: {str(e)}")
+                    raise
+    return app.state.table
+
+
+async def close_dynamodb() -> None:
+    """Close the shared DynamoDB resource"""
+    await _dynamodb_stack.aclose()
+    app.state.dynamodb = None
+    app.state.table = None
 
 
 # Custom Exception Handlers
@@ -73,7 +172,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -86,7 +185,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors"""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "An unexpected error occurred",
@@ -95,14 +194,15 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Enums and Models
-class EventStatus(str, Enum):
-    DRAFT = "draft"
-    PUBLISHED = "published"
-    CANCELLED = "cancelled"
-    COMPLETED = "completed"
-    ACTIVE = "active"  # Added for test compatibility
-    INACTIVE = "inactive"  # Added for test compatibility
+# Models
+EventStatus = Literal[
+    "draft",
+    "published",
+    "cancelled",
+    "completed",
+    "active",  # Added for test compatibility
+    "inactive",  # Added for test compatibility
+]
 
 
 class EventBase(BaseModel):
@@ -147,7 +247,7 @@ class EventBase(BaseModel):
         examples=["Tech Events Inc."]
     )
     status: EventStatus = Field(
-        default=EventStatus.DRAFT,
+        default="draft",
         description="Current status of the event"
     )
     
@@ -164,25 +264,10 @@ class EventBase(BaseModel):
     def validate_date_format(cls, v: str) -> str:
         """Validate ISO 8601 date format (supports both YYYY-MM-DD and YYYY-MM-DDTHH:MM:SS)"""
         try:
-            # Try to parse the date - supports both date and datetime formats
-            if 'T' in v or ' ' in v:
-                # Full datetime format
-                parsed_date = datetime.fromisoformat(v.replace('Z', '+00:00'))
-            else:
-                # Date only format (YYYY-MM-DD)
-                parsed_date = datetime.strptime(v, '%Y-%m-%d')
-            return v
+            # fromisoformat parses 'Z' and range-checks every field in C
+            datetime.fromisoformat(v)
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use ISO 8601 format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS): {str(e)}")
-    
-    @field_validator('capacity')
-    @classmethod
-    def validate_capacity(cls, v: int) -> int:
-        """Validate capacity is reasonable"""
-        if v <= 0:
-            raise ValueError("Capacity must be greater than 0")
-        if v > 1000000:
-            raise ValueError("Capacity cannot exceed 1,000,000")
         return v
 
 
@@ -228,20 +313,9 @@ class EventUpdate(BaseModel):
         if v is None:
             return None
         try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-            return v
+            datetime.fromisoformat(v)
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use ISO 8601 format (YYYY-MM-DDTHH:MM:SS): {str(e)}")
-    
-    @field_validator('capacity')
-    @classmethod
-    def validate_capacity(cls, v: Optional[int]) -> Optional[int]:
-        """Validate capacity is reasonable"""
-        if v is not None:
-            if v <= 0:
-                raise ValueError("Capacity must be greater than 0")
-            if v > 1000000:
-                raise ValueError("Capacity cannot exceed 1,000,000")
         return v
 
 
@@ -251,6 +325,20 @@ class Event(EventBase):
     updatedAt: str
 
 
+class EventStruct(msgspec.Struct):
+    """Event as read from DynamoDB; Event documents the same shape in OpenAPI"""
+    eventId: str
+    title: str
+    description: str
+    date: str
+    location: str
+    capacity: int
+    organizer: str
+    status: str
+    createdAt: str
+    updatedAt: str
+
+
 # Response Models
 class ErrorResponse(BaseModel):
     detail: str
@@ -262,7 +350,107 @@ class ValidationErrorResponse(BaseModel):
     errors: List[dict]
 
 
+# Batch Models
+class EventBatchCreate(BaseModel):
+    events: List[EventCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_WRITE_LIMIT,
+        description="Events to create"
+    )
+
+
+class EventBatchGet(BaseModel):
+    eventIds: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_GET_LIMIT,
+        description="IDs of the events to fetch"
+    )
+
+
+# Event cache
+# Per-instance cache of recently read events, keyed by eventId. Writes made
+# through this instance evict their entry; writes from other instances can
+# be served stale for up to the TTL.
+event_cache = TTLCache(maxsize=1024, ttl=30)
+# Bumped on every write so a read that overlapped a write doesn't re-cache
+# the pre-write item after the write evicted it
+event_write_count = 0
+
+
+def invalidate_event(event_id: str) -> None:
+    """Evict an event from the cache after any write attempt on it"""
+    global event_write_count
+    event_write_count += 1
+    event_cache.pop(event_id, None)
+
+
 # Helper functions
+def iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds"""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f'.{nanos // 1000:06d}'
+
+
+@functools.lru_cache(maxsize=128)
+def build_update_expression(fields: tuple) -> tuple:
+    """Build the UpdateExpression and ExpressionAttributeNames for a set of fields"""
+    update_expression = "SET " + ", ".join(f"#{k} = :{k}" for k in fields)
+    expression_attribute_names = {f"#{k}": k for k in fields}
+    return update_expression, expression_attribute_names
+
+
+@functools.lru_cache(maxsize=64)
+def status_key_condition(status_value: str):
+    """Key condition for querying the status index"""
+    return Key('status').eq(status_value)
+
+
+@functools.lru_cache(maxsize=256)
+def organizer_filter(organizer: str):
+    """Filter expression matching organizers containing the given text"""
+    return Attr('organizer').contains(organizer)
+
+
+def build_event_item(event: EventCreate, timestamp: str) -> dict:
+    """Build the DynamoDB item for a new event"""
+    # Use provided eventId or generate a new UUID
+    event_id = event.eventId if event.eventId else str(uuid.uuid4())
+    return {
+        "eventId": event_id,
+        "title": event.title,
+        "description": event.description,
+        "date": event.date,
+        "location": event.location,
+        "capacity": event.capacity,
+        "organizer": event.organizer,
+        "status": event.status,
+        "createdAt": timestamp,
+        "updatedAt": timestamp
+    }
+
+
+def _event_from_item(item: dict) -> EventStruct:
+    """Build the response struct for a DynamoDB item.
+
+    Items in the table were validated on write, so the read path skips
+    pydantic entirely. msgspec drops unknown attributes; capacity is
+    converted from DynamoDB's Decimal back to int first since msgspec
+    does not coerce Decimal to int.
+    """
+    return msgspec.convert({**item, 'capacity': int(item['capacity'])}, EventStruct)
+
+
+def msgspec_response(content, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode event structs with msgspec into a JSON response"""
+    return Response(
+        content=msgspec.json.encode(content),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 def validate_event_id(event_id: str) -> None:
     """Validate that event_id is not empty (supports both UUID and custom IDs)"""
     if not event_id or not event_id.strip():
@@ -272,6 +460,27 @@ def validate_event_id(event_id: str) -> None:
         )
 
 
+async def collect_items(operation, limit: int, **kwargs) -> List[dict]:
+    """Page through a DynamoDB scan/query until `limit` items are collected.
+
+    DynamoDB applies FilterExpression after reading each page, so a single
+    call can return fewer than `Limit` items even when more match.
+    """
+    items = []
+    while True:
+        response = await operation(**kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response or len(items) >= limit:
+            break
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items[:limit]
+
+
+def is_conditional_check_failed(e: ClientError) -> bool:
+    """Check whether a write was rejected by its ConditionExpression"""
+    return e.response['Error']['Code'] == 'ConditionalCheckFailedException'
+
+
 def handle_dynamodb_error(e: Exception, operation: str) -> None:
     """Handle DynamoDB errors with appropriate HTTP responses"""
     if isinstance(e, ClientError):
@@ -314,10 +523,10 @@ async def health():
 
 @app.post(
     "/events",
-    response_model=Event,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     responses={
-        201: {"description": "Event created successfully"},
+        201: {"model": Event, "description": "Event created successfully"},
         422: {"model": ValidationErrorResponse, "description": "Validation error"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
@@ -335,36 +544,118 @@ async def create_event(event: EventCreate):
     - **organizer**: Organizer name (1-200 characters)
     - **status**: Event status (draft, published, cancelled, completed, active, inactive)
     """
-    # Use provided eventId or generate a new UUID
-    event_id = event.eventId if event.eventId else str(uuid.uuid4())
-    timestamp = datetime.utcnow().isoformat()
+    item = build_event_item(event, iso_now())
     
-    item = {
-        "eventId": event_id,
-        "title": event.title,
-        "description": event.description,
-        "date": event.date,
-        "location": event.location,
-        "capacity": event.capacity,
-        "organizer": event.organizer,
-        "status": event.status.value,
-        "createdAt": timestamp,
-        "updatedAt": timestamp
+    try:
+        table = await get_table()
+        try:
+            await table.put_item(Item=item)
+        finally:
+            # A failed or timed-out write may still have been applied
+            invalidate_event(item['eventId'])
+        logger.info(f"Created event: {item['eventId']}")
+        return msgspec_response(_event_from_item(item), status.HTTP_201_CREATED)
+    except Exception as e:
+        handle_dynamodb_error(e, "create event")
+
+
+@app.post(
+    "/events/batch",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"model": List[Event], "description": "Events created successfully"},
+        400: {"model": ErrorResponse, "description": "Duplicate eventIds in batch"},
+        422: {"model": ValidationErrorResponse, "description": "Validation error or invalid batch size"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
     }
+)
+async def batch_create_events(request: EventBatchCreate):
+    """
+    Create up to 25 events in a single request
+    
+    - **events**: Events with the same fields as **POST /events**
+    - Events are written with DynamoDB BatchWriteItem
+    """
+    timestamp = iso_now()
+    items = [build_event_item(event, timestamp) for event in request.events]
+    
+    # BatchWriteItem would keep only one of several items with the same key
+    if len({item['eventId'] for item in items}) != len(items):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch contains duplicate eventIds"
+        )
     
     try:
-        table.put_item(Item=item)
-        logger.info(f"Created event: {event_id}")
-        return Event(**item)
+        table = await get_table()
+        try:
+            async with table.batch_writer() as batch:
+                for item in items:
+                    await batch.put_item(Item=item)
+        finally:
+            # A failed or timed-out write may still have been applied
+            for item in items:
+                invalidate_event(item['eventId'])
+        logger.info(f"Created {len(items)} events in batch")
+        return msgspec_response(
+            [_event_from_item(item) for item in items],
+            status.HTTP_201_CREATED
+        )
     except Exception as e:
-        handle_dynamodb_error(e, "create event")
+        handle_dynamodb_error(e, "create events")
+
+
+@app.post(
+    "/events/batch-get",
+    response_model=None,
+    responses={
+        200: {"model": List[Event], "description": "Events found for the requested IDs"},
+        422: {"model": ValidationErrorResponse, "description": "Validation error or invalid batch size"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+async def batch_get_events(request: EventBatchGet):
+    """
+    Get up to 100 events by ID in a single request
+    
+    - **eventIds**: IDs of the events to fetch
+    - IDs that do not exist are omitted from the response
+    """
+    # BatchGetItem rejects duplicate keys
+    event_ids = list(dict.fromkeys(request.eventIds))
+    
+    try:
+        await get_table()
+        dynamodb = app.state.dynamodb
+        request_items = {table_name: {'Keys': [{'eventId': i} for i in event_ids]}}
+        found = {}
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                # Unprocessed keys mean the table is throttling; back off
+                await asyncio.sleep(BATCH_GET_BASE_DELAY * 2 ** (attempt - 1))
+            response = await dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(table_name, []):
+                found[item['eventId']] = item
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                break
+        else:
+            raise RuntimeError(
+                f"Keys still unprocessed after {BATCH_GET_MAX_ATTEMPTS} BatchGetItem attempts"
+            )
+        
+        logger.info(f"Retrieved {len(found)} of {len(event_ids)} events in batch")
+        return msgspec_response([_event_from_item(found[i]) for i in event_ids if i in found])
+    except Exception as e:
+        handle_dynamodb_error(e, "get events")
 
 
 @app.get(
     "/events",
-    response_model=List[Event],
+    response_model=None,
     responses={
-        200: {"description": "List of events"},
+        200: {"model": List[Event], "description": "List of events"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
 )
@@ -389,38 +680,38 @@ async def list_events(
         )
     
     try:
-        # Build filter expression
-        filter_expressions = []
+        table = await get_table()
         
         # Support both 'status' and 'status_filter' parameters
-        status_value = status or (status_filter.value if status_filter else None)
-        if status_value:
-            filter_expressions.append(Attr('status').eq(status_value))
+        status_value = status or status_filter
         
+        query_kwargs = {'Limit': limit}
         if organizer:
-            filter_expressions.append(Attr('organizer').contains(organizer))
+            query_kwargs['FilterExpression'] = organizer_filter(organizer)
         
-        # Combine filters
-        if filter_expressions:
-            combined_filter = filter_expressions[0]
-            for expr in filter_expressions[1:]:
-                combined_filter = combined_filter & expr
-            response = table.scan(FilterExpression=combined_filter, Limit=limit)
+        if status_value:
+            # Query the status index instead of scanning the whole table
+            items = await collect_items(
+                table.query,
+                limit,
+                IndexName=STATUS_INDEX_NAME,
+                KeyConditionExpression=status_key_condition(status_value),
+                **query_kwargs
+            )
         else:
-            response = table.scan(Limit=limit)
+            items = await collect_items(table.scan, limit, **query_kwargs)
         
-        items = response.get('Items', [])
         logger.info(f"Retrieved {len(items)} events")
-        return [Event(**item) for item in items]
+        return msgspec_response([_event_from_item(item) for item in items])
     except Exception as e:
         handle_dynamodb_error(e, "list events")
 
 
 @app.get(
     "/events/{event_id}",
-    response_model=Event,
+    response_model=None,
     responses={
-        200: {"description": "Event details"},
+        200: {"model": Event, "description": "Event details"},
         400: {"model": ErrorResponse, "description": "Invalid event ID"},
         404: {"model": ErrorResponse, "description": "Event not found"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
@@ -434,8 +725,16 @@ async def get_event(event_id: str):
     """
     validate_event_id(event_id)
     
+    cached = event_cache.get(event_id)
+    if cached is not None:
+        return msgspec_response(cached)
+    
     try:
-        response = table.get_item(Key={'eventId': event_id})
+        table = await get_table()
+        writes_before_read = event_write_count
+        # Strongly consistent so a read after a write here never caches the
+        # pre-write item
+        response = await table.get_item(Key={'eventId': event_id}, ConsistentRead=True)
         
         if 'Item' not in response:
             logger.warning(f"Event not found: {event_id}")
@@ -445,7 +744,10 @@ async def get_event(event_id: str):
             )
         
         logger.info(f"Retrieved event: {event_id}")
-        return Event(**response['Item'])
+        event = _event_from_item(response['Item'])
+        if event_write_count == writes_before_read:
+            event_cache[event_id] = event
+        return msgspec_response(event)
     except HTTPException:
         raise
     except Exception as e:
@@ -454,9 +756,9 @@ async def get_event(event_id: str):
 
 @app.put(
     "/events/{event_id}",
-    response_model=Event,
+    response_model=None,
     responses={
-        200: {"description": "Event updated successfully"},
+        200: {"model": Event, "description": "Event updated successfully"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
         404: {"model": ErrorResponse, "description": "Event not found"},
         422: {"model": ValidationErrorResponse, "description": "Validation error"},
@@ -473,14 +775,7 @@ async def update_event(event_id: str, event_update: EventUpdate):
     validate_event_id(event_id)
     
     try:
-        # Check if event exists
-        response = table.get_item(Key={'eventId': event_id})
-        if 'Item' not in response:
-            logger.warning(f"Event not found for update: {event_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Event with ID {event_id} not found"
-            )
+        table = await get_table()
         
         # Build update expression
         update_data = event_update.model_dump(exclude_unset=True)
@@ -490,22 +785,35 @@ async def update_event(event_id: str, event_update: EventUpdate):
                 detail="No fields to update"
             )
         
-        update_data['updatedAt'] = datetime.utcnow().isoformat()
+        update_data['updatedAt'] = iso_now()
         
-        update_expression = "SET " + ", ".join([f"#{k} = :{k}" for k in update_data.keys()])
-        expression_attribute_names = {f"#{k}": k for k in update_data.keys()}
-        expression_attribute_values = {f":{k}": v.value if isinstance(v, EventStatus) else v for k, v in update_data.items()}
+        update_expression, expression_attribute_names = build_update_expression(tuple(sorted(update_data)))
+        expression_attribute_values = {f":{k}": v for k, v in update_data.items()}
         
-        response = table.update_item(
-            Key={'eventId': event_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=expression_attribute_values,
-            ReturnValues='ALL_NEW'
-        )
+        try:
+            # The condition replaces a separate existence check
+            response = await table.update_item(
+                Key={'eventId': event_id},
+                UpdateExpression=update_expression,
+                ConditionExpression='attribute_exists(eventId)',
+                ExpressionAttributeNames=expression_attribute_names,
+                ExpressionAttributeValues=expression_attribute_values,
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if not is_conditional_check_failed(e):
+                raise
+            logger.warning(f"Event not found for update: {event_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Event with ID {event_id} not found"
+            )
+        finally:
+            # A failed or timed-out write may still have been applied
+            invalidate_event(event_id)
         
         logger.info(f"Updated event: {event_id}")
-        return Event(**response['Attributes'])
+        return msgspec_response(_event_from_item(response['Attributes']))
     except HTTPException:
         raise
     except Exception as e:
@@ -531,16 +839,26 @@ async def delete_event(event_id: str):
     validate_event_id(event_id)
     
     try:
-        # Check if event exists
-        response = table.get_item(Key={'eventId': event_id})
-        if 'Item' not in response:
+        table = await get_table()
+        
+        try:
+            # The condition replaces a separate existence check
+            await table.delete_item(
+                Key={'eventId': event_id},
+                ConditionExpression='attribute_exists(eventId)'
+            )
+        except ClientError as e:
+            if not is_conditional_check_failed(e):
+                raise
             logger.warning(f"Event not found for deletion: {event_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with ID {event_id} not found"
             )
+        finally:
+            # A failed or timed-out write may still have been applied
+            invalidate_event(event_id)
         
-        table.delete_item(Key={'eventId': event_id})
         logger.info(f"Deleted event: {event_id}")
         return None
     except HTTPException:
@@ -553,6 +871,10 @@ async def delete_event(event_id: str):
 try:
     from mangum import Mangum
     handler = Mangum(app, lifespan="off")
+    if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        # Open the DynamoDB resource during Lambda init rather than on the
+        # first request. Mangum runs every invocation on this same loop.
+        asyncio.get_event_loop().run_until_complete(get_table())
 except ImportError:
     # Mangum not available (local development)
     handler = None